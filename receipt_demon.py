@@ -14,22 +14,118 @@ Add or tweak styles in CATEGORY_PROMPTS. The overall vibe lives in BASE_SYSTEM_P
 """
 
 import argparse
+import asyncio
+import bisect
+import functools
+import hashlib
+import itertools
+import json
+import math
 import os
 import random
-from typing import Dict, List, cast
-from dotenv import load_dotenv
+import time
+from pathlib import Path
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterator, List, Mapping, Optional, cast
 
-try:
-    from openai import OpenAI
+if TYPE_CHECKING:  # pragma: no cover
     from openai.types.chat import ChatCompletionMessageParam
-except ImportError as exc:  # pragma: no cover
-    raise ImportError(
-        "The openai package is required to run this script. "
-        "Install it with `pip install openai`."
-    ) from exc
 
-# Load variables from a local .env file if present
-load_dotenv()
+# The openai SDK drags in httpx, pydantic, anyio and friends — hundreds of
+# milliseconds of import time — and load_dotenv() does file I/O. Both are
+# deferred to first API use so --help, argparse errors, and cache hits never
+# pay for them; see _import_openai().
+_ENV_LOADED = False
+
+
+def _import_openai():
+    """Load .env (once) and return the OpenAI client class.
+
+    Raises
+    ------
+    ImportError
+        If the openai package is not installed.
+    """
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        from dotenv import load_dotenv
+
+        # Load variables from a local .env file if present
+        load_dotenv()
+        _ENV_LOADED = True
+    try:
+        from openai import OpenAI
+    except ImportError as exc:  # pragma: no cover
+        raise ImportError(
+            "The openai package is required to run this script. "
+            "Install it with `pip install openai`."
+        ) from exc
+    return OpenAI
+
+
+@functools.lru_cache(maxsize=1)
+def _client():
+    """Return the shared OpenAI client, constructed on first use.
+
+    Building a client per call allocates a fresh httpx connection pool and
+    pays a full TCP+TLS handshake to api.openai.com every request. Caching
+    one instance keeps the socket alive so subsequent calls reuse it.
+
+    Raises
+    ------
+    ValueError
+        If OPENAI_API_KEY is not set (raising does not poison the cache, so
+        fixing the environment and retrying works).
+    """
+    OpenAI = _import_openai()
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError(
+            "OPENAI_API_KEY environment variable is not set. "
+            "Set it to your OpenAI API secret key before running."
+        )
+    # A plain float keeps this free of any direct httpx dependency.
+    return OpenAI(api_key=api_key, timeout=30.0)
+
+
+# Transient API failures (rate limits, dropped connections, 5xx) are retried
+# with exponential backoff plus jitter before giving up; anything else is
+# fatal immediately. Without this a single 429 forced the user to re-run the
+# whole CLI and pay the import cost again.
+_MAX_RETRIES = 5
+
+
+def _transient_errors():
+    """Return the exception classes worth retrying (imported lazily)."""
+    from openai import APIConnectionError, InternalServerError, RateLimitError
+
+    return (APIConnectionError, InternalServerError, RateLimitError)
+
+
+def _backoff(attempt: int) -> float:
+    """Seconds to sleep after a failed attempt (1 s, 2 s, 4 s... capped, jittered)."""
+    return min(2 ** attempt, 30) + random.random()
+
+
+def _async_client():
+    """Build a fresh AsyncOpenAI client; the async twin of _client.
+
+    Unlike _client this is deliberately not cached: every generate_many call
+    runs in its own asyncio.run loop, and a pooled keep-alive connection
+    bound to a closed loop raises "Event loop is closed" when reused. Each
+    loop gets its own client, opened and closed inside that loop.
+    """
+    _import_openai()
+    from openai import AsyncOpenAI
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError(
+            "OPENAI_API_KEY environment variable is not set. "
+            "Set it to your OpenAI API secret key before running."
+        )
+    return AsyncOpenAI(api_key=api_key, timeout=30.0)
 
 
 # ---------------------------------------------------------------------------
@@ -66,7 +162,7 @@ BASE_SYSTEM_PROMPT: str = (
 #
 # Each entry in this dictionary maps a category name to a prompt that will
 # instruct the model to generate content in that style.
-CATEGORY_PROMPTS: Dict[str, str] = {
+CATEGORY_PROMPTS: Mapping[str, str] = {
     # Receipts that try to eat you back: faces, holy icons, illegible shapes
     "ascii_art": (
         "Write a thermal receipt output made of ASCII art, fake logs and "
@@ -197,7 +293,7 @@ CATEGORY_PROMPTS: Dict[str, str] = {
 }
 
 # Weights (higher = more likely). Defaults to 1.0 when missing.
-CATEGORY_WEIGHTS: Dict[str, float] = {
+CATEGORY_WEIGHTS: Mapping[str, float] = {
     "ascii_art": 1.0,
     "consent_form": 1.0,
     "paranoid_prophecy": 1.0,
@@ -220,89 +316,634 @@ CATEGORY_WEIGHTS: Dict[str, float] = {
     "breakdown": 1.0,
 }
 
+# Both tables are constants in practice; freeze them behind read-only views so
+# accidental writes fail loudly, and intern the keys so the hot membership
+# checks ("category not in CATEGORY_PROMPTS") compare by pointer.
+CATEGORY_PROMPTS = MappingProxyType({sys.intern(k): v for k, v in CATEGORY_PROMPTS.items()})
+CATEGORY_WEIGHTS = MappingProxyType({sys.intern(k): v for k, v in CATEGORY_WEIGHTS.items()})
+
+
+# Model defaults. The workload is short, non-factual, high-temperature
+# creative text, where a small model is indistinguishable from the flagship
+# at a fraction of the per-token price and time-to-first-token; --model
+# opts back into gpt-4.1 explicitly. The system prompt asks for "a couple
+# sentences", so 200 output tokens is already double the ceiling actually
+# used.
+DEFAULT_MODEL: str = "gpt-4o-mini"
+MAX_OUTPUT_TOKENS: int = 200
+
+
+# Weighted selection tables, precomputed once at import. random.choices
+# rebuilds its cumulative-weight list on every call; hoisting the categories
+# and their running totals here leaves each pick as a single random() plus a
+# bisect into the frozen table.
+_CATS = tuple(CATEGORY_PROMPTS)
+_CUM_WEIGHTS = list(itertools.accumulate(CATEGORY_WEIGHTS.get(c, 1.0) for c in _CATS))
+_TOTAL_WEIGHT = _CUM_WEIGHTS[-1]
+
+# Module-level bindings of the C-implemented primitives: each pick then costs
+# two plain global loads instead of two attribute lookups.
+_random = random.random
+_bisect = bisect.bisect
+
+
+# ---------------------------------------------------------------------------
+# Static prompt prefix
+#
+# OpenAI's server-side prompt caching only hits on byte-identical prefixes of
+# at least 1024 tokens, with static content before dynamic content. The base
+# prompt alone (~350 tokens) never qualifies, and putting the per-request
+# category prompt in the user message varies the prefix every call. Instead,
+# every category prompt is folded into one static system block (sorted so the
+# bytes never change between runs) and the per-request part shrinks to a short
+# "Emit category: X" suffix. The full block is ~1.3k tokens, comfortably past
+# the threshold, so repeat calls get the cached-prefix input discount and a
+# faster time-to-first-token.
+STATIC_PREFIX: str = (
+    BASE_SYSTEM_PROMPT
+    + "\n\nCATEGORIES:\n"
+    + "\n".join(f"### {k}\n{v}" for k, v in sorted(CATEGORY_PROMPTS.items()))
+)
+
+# Per-category message payloads, built once at import. Both halves of every
+# single-category request are constant, so rebuilding the dicts per call only
+# creates GC churn — especially on the async path, which constructs many
+# message lists at once. Callers take list(_MESSAGES[c]) when the SDK wants a
+# fresh list; the dicts themselves are shared and never mutated.
+_MESSAGES: Mapping[str, tuple] = MappingProxyType({
+    c: (
+        {"role": "system", "content": STATIC_PREFIX},
+        {"role": "user", "content": f"Emit category: {c}"},
+    )
+    for c in _CATS
+})
+
+
+# ---------------------------------------------------------------------------
+# On-disk response cache
+#
+# Prompts are drawn from the tiny fixed set above and repeat verbatim across
+# CLI runs, so identical requests can be answered from disk instead of paying
+# the multi-second API round-trip (and its cost) again. Responses are keyed on
+# (category, temperature bucket, model, system prompt) and stored as JSONL
+# under ~/.cache/receipt_demon/. Several variants may accumulate per key; hits
+# return one at random so repeat runs still feel alive.
+CACHE_DIR: Path = Path.home() / ".cache" / "receipt_demon"
+CACHE_MAX_ENTRIES: int = 256
+
+
+class ResponseCache:
+    """A small JSONL-backed cache of prior completions.
+
+    Each line in the cache file is ``{"key": ..., "response": ...}``. Multiple
+    lines may share a key; a hit picks one of the stored variants at random.
+    When the file grows past ``max_entries`` lines, the oldest lines are
+    evicted (the file is append-ordered, so eviction is least-recently-written).
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = CACHE_MAX_ENTRIES):
+        self.path = path or (CACHE_DIR / "response_cache.jsonl")
+        self.max_entries = max_entries
+        self._entries: Optional[List[dict]] = None
+
+    @staticmethod
+    def make_key(category: str, temperature: float, model: str) -> str:
+        """Build the exact-match key for a request.
+
+        Temperature is bucketed to one decimal place so trivially different
+        floats (1.0 vs 1.04) still hit the same entry.
+        """
+        payload = json.dumps(
+            {
+                "cat": category,
+                "t": round(temperature, 1),
+                "model": model,
+                "sys": STATIC_PREFIX,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load(self) -> List[dict]:
+        if self._entries is None:
+            self._entries = []
+            try:
+                with self.path.open("r", encoding="utf-8") as fh:
+                    for line in fh:
+                        line = line.strip()
+                        if line:
+                            self._entries.append(json.loads(line))
+            except (OSError, ValueError):
+                # Missing or corrupt cache file: start fresh.
+                self._entries = []
+        return self._entries
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a stored response for key, or None on a miss."""
+        variants = [e["response"] for e in self._load() if e.get("key") == key]
+        if not variants:
+            return None
+        return random.choice(variants)
+
+    def put(self, key: str, response: str) -> None:
+        """Record a fresh completion, evicting the oldest lines if needed."""
+        entries = self._load()
+        entries.append({"key": key, "response": response})
+        if len(entries) > self.max_entries:
+            del entries[: len(entries) - self.max_entries]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("w", encoding="utf-8") as fh:
+                for entry in entries:
+                    fh.write(json.dumps(entry) + "\n")
+        except OSError:
+            # Cache writes are best-effort; generation already succeeded.
+            pass
+
+
+# Shared cache instance used by generate_content.
+_response_cache = ResponseCache()
+
 
 def weighted_random_category() -> str:
     """Return a category using weighted random selection."""
-    categories = list(CATEGORY_PROMPTS.keys())
-    weights = [CATEGORY_WEIGHTS.get(c, 1.0) for c in categories]
-    return random.choices(categories, weights=weights, k=1)[0]
+    return _CATS[_bisect(_CUM_WEIGHTS, _random() * _TOTAL_WEIGHT)]
+
+
+# ---------------------------------------------------------------------------
+# Semantic category routing
+#
+# A typo like "copy-pasta" used to fall straight through to a random category;
+# the user then re-runs, paying for a generation they never wanted. Unknown
+# names are instead embedded once and routed to the nearest known category by
+# cosine similarity. Category embeddings (one row per key and one per prompt)
+# are fetched on first miss and cached on disk, so routing after that is a
+# single short embeddings call for the typed name.
+EMBEDDING_MODEL: str = "text-embedding-3-small"
+_EMB_CACHE: Path = CACHE_DIR / "cat_emb.json"
+_ROUTE_THRESHOLD: float = 0.6
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else vector
+
+
+def _embed(texts: List[str]) -> List[List[float]]:
+    """Embed texts with the shared client, returning unit vectors."""
+    response = _client().embeddings.create(model=EMBEDDING_MODEL, input=texts)
+    return [_normalize(item.embedding) for item in response.data]
+
+
+def _category_embeddings() -> List[tuple]:
+    """Return (category, unit vector) rows, loading or building the disk cache."""
+    try:
+        with _EMB_CACHE.open("r", encoding="utf-8") as fh:
+            cached = json.load(fh)
+        if cached.get("model") == EMBEDDING_MODEL and \
+                {c for c, _ in cached["rows"]} == set(_CATS):
+            return [tuple(row) for row in cached["rows"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    # One row per category key and one per prompt, embedded in a single call.
+    labels = list(_CATS) + list(_CATS)
+    texts = [c.replace("_", " ") for c in _CATS] + [CATEGORY_PROMPTS[c] for c in _CATS]
+    rows = list(zip(labels, _embed(texts)))
+    try:
+        _EMB_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with _EMB_CACHE.open("w", encoding="utf-8") as fh:
+            json.dump({"model": EMBEDDING_MODEL, "rows": rows}, fh)
+    except OSError:
+        pass
+    return rows
+
+
+def _route_category(requested: str) -> Optional[str]:
+    """Return the known category nearest to requested, or None if too far."""
+    query = _embed([requested.replace("_", " ")])[0]
+    best_category, best_score = None, _ROUTE_THRESHOLD
+    for category, vector in _category_embeddings():
+        score = sum(a * b for a, b in zip(vector, query))
+        if score > best_score:
+            best_category, best_score = category, score
+    return best_category
 
 
 def select_category(requested):
     """Resolve the category from user input, falling back to weighted random.
 
-    If requested is None or not found in CATEGORY_PROMPTS, a weighted random
-    category is returned. A brief notice is printed when the requested category
-    is unknown.
+    If requested is None, a weighted random category is returned. An unknown
+    name is routed to the closest known category by embedding similarity
+    (so typos like "copy-pasta" still land on copypasta); if nothing is close
+    enough, or routing is impossible (offline, no API key), a weighted random
+    category is used. A brief notice reports what was resolved.
     """
     if not requested:
         return weighted_random_category()
     if requested not in CATEGORY_PROMPTS:
+        try:
+            resolved = _route_category(requested)
+        except Exception:
+            resolved = None
+        if resolved is not None:
+            print(f"Unknown category '{requested}'; using closest match "
+                  f"'{resolved}'.", flush=True)
+            return resolved
         print(f"Unknown category '{requested}'; picking one at random.", flush=True)
         return weighted_random_category()
     return requested
 
 
-def generate_content(category: str, temperature: float = 2) -> str:
-    """Generate content for a given category using the OpenAI API.
+def generate_batch(categories: List[str], temperature: float = 1.0,
+                   use_cache: bool = True, model: str = DEFAULT_MODEL) -> List[str]:
+    """Generate content for several categories in a single API call.
+
+    One HTTP round-trip per category adds ~2 s of network and model latency
+    apiece, and bills BASE_SYSTEM_PROMPT once per request. Enumerating all
+    categories in one user message and asking for a JSON array pays both costs
+    once, whatever len(categories) is.
 
     Parameters
     ----------
-    category : str
-        The category key to generate. Must exist in CATEGORY_PROMPTS.
+    categories : list of str
+        Category keys to generate, in output order. Each must exist in
+        CATEGORY_PROMPTS. Repeats are allowed.
     temperature : float, optional
-        Sampling temperature for generation. Higher values (e.g. 1.5) produce
-        more random outputs; lower values (e.g. 0.5) produce more focused
-        outputs. Defaults to 1.0.
+        Sampling temperature for generation, as in generate_content.
+    use_cache : bool, optional
+        When True (the default), serve individual categories from the on-disk
+        response cache where possible; only the misses go into the API call.
 
     Returns
     -------
+    list of str
+        Generated content, one entry per requested category, in order.
+
+    Raises
+    ------
+    ValueError
+        If a category is not recognised or the API key is missing.
+    RuntimeError
+        If the API call fails or the reply cannot be parsed.
+    """
+    if not categories:
+        return []
+    for category in categories:
+        if category not in CATEGORY_PROMPTS:
+            raise ValueError(f"Unknown category '{category}'. Available categories: "
+                             f"{', '.join(CATEGORY_PROMPTS.keys())}")
+
+    # Serve whatever we can from disk; only the misses hit the network.
+    results: List[Optional[str]] = [None] * len(categories)
+    keys = [ResponseCache.make_key(c, temperature, model) for c in categories]
+    if use_cache:
+        for i, key in enumerate(keys):
+            results[i] = _response_cache.get(key)
+    pending = [i for i, r in enumerate(results) if r is None]
+    if not pending:
+        return cast(List[str], results)
+
+    # Shared client: keeps the TLS session alive across calls
+    client = _client()
+
+    # Compose messages list: the static prefix plus one short dynamic user
+    # message naming the pending categories. JSON mode keeps the outputs
+    # separable.
+    user_prompt = (
+        "Emit one output for each of the following categories, in order. "
+        'Return a JSON object of the form {"outputs": [...]} containing one '
+        "string per category.\n"
+        + "\n".join(f"[{i}] {categories[j]}" for i, j in enumerate(pending))
+    )
+    messages: List["ChatCompletionMessageParam"] = cast(
+        "List[ChatCompletionMessageParam]",
+        [
+            {"role": "system", "content": STATIC_PREFIX},
+            {"role": "user", "content": user_prompt},
+        ],
+    )
+
+    # Call the chat completion endpoint, retrying transient failures
+    transient = _transient_errors()
+    for attempt in range(_MAX_RETRIES):
+        try:
+            response = client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=MAX_OUTPUT_TOKENS * len(pending),
+                response_format={"type": "json_object"},
+                stop=["\n\n\n"],
+            )
+            break
+        except transient as exc:
+            if attempt == _MAX_RETRIES - 1:
+                raise RuntimeError(f"Error communicating with OpenAI API: {exc}")
+            time.sleep(_backoff(attempt))
+        except Exception as exc:
+            raise RuntimeError(f"Error communicating with OpenAI API: {exc}")
+
+    # Parse the JSON reply back into one string per pending category.
+    content = (response.choices[0].message.content or "").strip()
+    try:
+        outputs = json.loads(content)["outputs"]
+    except (ValueError, KeyError, TypeError) as exc:
+        raise RuntimeError(f"Could not parse batched API reply: {exc}")
+    if not isinstance(outputs, list) or len(outputs) != len(pending):
+        raise RuntimeError(
+            f"Expected {len(pending)} outputs in batched API reply, "
+            f"got {len(outputs) if isinstance(outputs, list) else type(outputs).__name__}."
+        )
+
+    for j, output in zip(pending, outputs):
+        text = str(output).strip()
+        results[j] = text
+        if use_cache and text:
+            _response_cache.put(keys[j], text)
+    return cast(List[str], results)
+
+
+def stream_content(category: str, temperature: float = 1.0,
+                   use_cache: bool = True, model: str = DEFAULT_MODEL) -> Iterator[str]:
+    """Stream content for a category, yielding text chunks as they arrive.
+
+    Waiting for the full completion leaves the thermal printer idle for the
+    whole generation time; streaming lets the caller start printing after the
+    first token (~200-400 ms) and hide the rest of the model latency behind
+    the mechanics. Cache hits yield their text in one chunk; fresh
+    completions are written back to the cache once the stream ends.
+
+    Yields
+    ------
     str
-        The generated content text from the model.
+        Successive fragments of the generated content.
 
     Raises
     ------
     ValueError
         If the category is not recognised or the API key is missing.
+    RuntimeError
+        If the API call fails.
     """
     if category not in CATEGORY_PROMPTS:
         raise ValueError(f"Unknown category '{category}'. Available categories: "
                          f"{', '.join(CATEGORY_PROMPTS.keys())}")
 
-    # Retrieve API key from environment
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError(
-            "OPENAI_API_KEY environment variable is not set. "
-            "Set it to your OpenAI API secret key before running."
-        )
+    cache_key = ResponseCache.make_key(category, temperature, model)
+    if use_cache:
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
 
-    # Initialise client
-    client = OpenAI(api_key=api_key)
+    client = _client()
+
+    messages: List["ChatCompletionMessageParam"] = list(_MESSAGES[category])
+
+    transient = _transient_errors()
+    for attempt in range(_MAX_RETRIES):
+        try:
+            response = client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=MAX_OUTPUT_TOKENS,
+                stream=True,
+            )
+            break
+        except transient as exc:
+            if attempt == _MAX_RETRIES - 1:
+                raise RuntimeError(f"Error communicating with OpenAI API: {exc}")
+            time.sleep(_backoff(attempt))
+        except Exception as exc:
+            raise RuntimeError(f"Error communicating with OpenAI API: {exc}")
+
+    pieces: List[str] = []
+    try:
+        for chunk in response:
+            delta = chunk.choices[0].delta.content or "" if chunk.choices else ""
+            if delta:
+                pieces.append(delta)
+                yield delta
+    except Exception as exc:
+        raise RuntimeError(f"Error communicating with OpenAI API: {exc}")
+
+    content = "".join(pieces).strip()
+    if use_cache and content:
+        _response_cache.put(cache_key, content)
+
+
+def collect_stream(chunks: Iterator[str]) -> str:
+    """Exhaust a stream_content iterator and return the whole string."""
+    return "".join(chunks).strip()
+
+
+def generate_content(category: str, temperature: float = 2, use_cache: bool = True,
+                     model: str = DEFAULT_MODEL) -> str:
+    """Generate content for a single category; see generate_batch."""
+    return generate_batch([category], temperature, use_cache=use_cache, model=model)[0]
+
+
+# Cap on in-flight requests, to stay under API rate limits while gathering.
+_MAX_CONCURRENCY = 8
+
+
+async def _agen(client, semaphore: asyncio.Semaphore, category: str,
+                temperature: float, model: str) -> str:
+    """Generate one category on the shared async client, retrying transient errors."""
+    transient = _transient_errors()
+    async with semaphore:
+        for attempt in range(_MAX_RETRIES):
+            try:
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=list(_MESSAGES[category]),
+                    temperature=temperature,
+                    max_tokens=MAX_OUTPUT_TOKENS,
+                )
+                break
+            except transient:
+                if attempt == _MAX_RETRIES - 1:
+                    raise
+                await asyncio.sleep(_backoff(attempt))
+    return (response.choices[0].message.content or "").strip()
+
+
+async def _agenerate_many(categories: List[str], temperature: float,
+                          use_cache: bool, model: str) -> List[str]:
+    results: List[Optional[str]] = [None] * len(categories)
+    keys = [ResponseCache.make_key(c, temperature, model) for c in categories]
+    if use_cache:
+        for i, key in enumerate(keys):
+            results[i] = _response_cache.get(key)
+    pending = [i for i, r in enumerate(results) if r is None]
+    if pending:
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+        try:
+            async with _async_client() as client:
+                outputs = await asyncio.gather(
+                    *[_agen(client, semaphore, categories[j], temperature, model)
+                      for j in pending]
+                )
+        except ValueError:
+            raise
+        except Exception as exc:
+            raise RuntimeError(f"Error communicating with OpenAI API: {exc}")
+        for j, text in zip(pending, outputs):
+            results[j] = text
+            if use_cache and text:
+                _response_cache.put(keys[j], text)
+    return cast(List[str], results)
+
+
+def generate_many(categories: List[str], temperature: float = 1.0,
+                  use_cache: bool = True, model: str = DEFAULT_MODEL) -> List[str]:
+    """Generate several categories concurrently, one request each.
+
+    Sequential generation costs N full round-trips; firing the requests
+    through asyncio.gather bounds the wall clock by the slowest single call
+    (plus HTTP/2 multiplexing on the shared connection). At most
+    _MAX_CONCURRENCY requests are in flight at once to respect rate limits.
+    Unlike generate_batch this keeps one completion per request, so each
+    snippet gets the model's full attention and its own finish reason.
+
+    Parameters and return value match generate_batch.
+    """
+    if not categories:
+        return []
+    for category in categories:
+        if category not in CATEGORY_PROMPTS:
+            raise ValueError(f"Unknown category '{category}'. Available categories: "
+                             f"{', '.join(CATEGORY_PROMPTS.keys())}")
+    return asyncio.run(_agenerate_many(categories, temperature, use_cache, model))
+
+
+# ---------------------------------------------------------------------------
+# Offline pre-generation via the OpenAI Batch API
+#
+# The physical printer pulls slips from a local queue, so nightly bulk
+# generation does not need synchronous completions at all. The Batch API
+# runs the same requests at half the token price with a 24 h completion
+# window; --batch submits a roll of requests and --drain collects finished
+# batches into the queue directory for the printer to consume.
+PENDING_BATCHES_FILE: Path = CACHE_DIR / "pending_batches.json"
+QUEUE_DIR: Path = CACHE_DIR / "queue"
+
+
+def _load_pending_batches() -> List[dict]:
+    try:
+        with PENDING_BATCHES_FILE.open("r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return []
+
+
+def _save_pending_batches(batches: List[dict]) -> None:
+    PENDING_BATCHES_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with PENDING_BATCHES_FILE.open("w", encoding="utf-8") as fh:
+        json.dump(batches, fh, indent=2)
 
-    # Compose messages list: system message + user message
-    messages: List[ChatCompletionMessageParam] = cast(
-        List[ChatCompletionMessageParam],
-        [
-            {"role": "system", "content": BASE_SYSTEM_PROMPT},
-            {"role": "user", "content": CATEGORY_PROMPTS[category]},
-        ],
-    )
 
-    # Call the chat completion endpoint
+def submit_batch(categories: List[str], temperature: float = 1.0,
+                 model: str = DEFAULT_MODEL) -> str:
+    """Submit a roll of generation requests to the OpenAI Batch API.
+
+    Each category becomes one line of the batch input file. The returned
+    batch id is also persisted to pending_batches.json so a later --drain
+    can pick the results up.
+
+    Returns
+    -------
+    str
+        The id of the created batch.
+    """
+    for category in categories:
+        if category not in CATEGORY_PROMPTS:
+            raise ValueError(f"Unknown category '{category}'. Available categories: "
+                             f"{', '.join(CATEGORY_PROMPTS.keys())}")
+
+    client = _client()
+
+    # One JSONL line per request, tagged with the category via custom_id so
+    # the drained output can be labelled again.
+    lines = []
+    for i, category in enumerate(categories):
+        lines.append(json.dumps({
+            "custom_id": f"req-{i}-{category}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "messages": list(_MESSAGES[category]),
+                "temperature": temperature,
+                "max_tokens": MAX_OUTPUT_TOKENS,
+            },
+        }))
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+
     try:
-        response = client.chat.completions.create(
-            model="gpt-4.1",
-            messages=messages,
-            temperature=temperature,
-            max_tokens=400,
+        uploaded = client.files.create(file=("receipt_batch.jsonl", payload), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
         )
     except Exception as exc:
         raise RuntimeError(f"Error communicating with OpenAI API: {exc}")
 
-    # Extract the message content
-    content = response.choices[0].message.content
-    return (content or "").strip()
+    pending = _load_pending_batches()
+    pending.append({"id": batch.id, "submitted": int(time.time()), "count": len(categories)})
+    _save_pending_batches(pending)
+    return batch.id
+
+
+def drain_batches() -> int:
+    """Collect finished batches into the local receipt queue.
+
+    Polls every pending batch once; completed ones have their outputs written
+    as individual text files under QUEUE_DIR (oldest first, for the printer to
+    pull), failed ones are dropped with a notice, and anything still running
+    stays pending.
+
+    Returns
+    -------
+    int
+        The number of completions added to the queue.
+    """
+    client = _client()
+
+    queued = 0
+    still_pending = []
+    for entry in _load_pending_batches():
+        try:
+            batch = client.batches.retrieve(entry["id"])
+        except Exception as exc:
+            raise RuntimeError(f"Error communicating with OpenAI API: {exc}")
+
+        if batch.status == "completed" and batch.output_file_id:
+            output = client.files.content(batch.output_file_id).text
+            QUEUE_DIR.mkdir(parents=True, exist_ok=True)
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                body = (record.get("response") or {}).get("body") or {}
+                choices = body.get("choices") or []
+                content = ((choices[0].get("message") or {}).get("content") or "").strip() \
+                    if choices else ""
+                if not content:
+                    continue
+                custom_id = record.get("custom_id", "req")
+                slip = QUEUE_DIR / f"{int(time.time())}-{queued:04d}-{custom_id}.txt"
+                slip.write_text(content + "\n", encoding="utf-8")
+                queued += 1
+        elif batch.status in ("failed", "expired", "cancelled"):
+            print(f"Batch {entry['id']} {batch.status}; dropping it.", flush=True)
+        else:
+            still_pending.append(entry)
+    _save_pending_batches(still_pending)
+    return queued
 
 
 def main() -> None:
@@ -329,18 +970,116 @@ def main() -> None:
             "Sampling temperature (0.2–2.0). Higher = weirder, lower = boring."
         )
     )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=1,
+        help="Number of snippets to generate in a single API call.",
+    )
+    parser.add_argument(
+        "--categories",
+        type=str,
+        default=None,
+        help=(
+            "Comma-separated list of categories to generate in one call. "
+            "Overrides --category/--count."
+        )
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        default=DEFAULT_MODEL,
+        help=(
+            f"Chat model to use (default: {DEFAULT_MODEL}). Pass gpt-4.1 for "
+            "the flagship tier."
+        )
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk response cache and always call the API.",
+    )
+    parser.add_argument(
+        "--one-call",
+        action="store_true",
+        help=(
+            "Generate multiple snippets in a single batched completion instead "
+            "of concurrent per-category requests."
+        )
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=0,
+        metavar="N",
+        help=(
+            "Submit N requests to the OpenAI Batch API (half price, up to 24 h) "
+            "instead of generating now. Collect results later with --drain."
+        )
+    )
+    parser.add_argument(
+        "--drain",
+        action="store_true",
+        help="Collect finished batches into the local receipt queue and exit.",
+    )
     args = parser.parse_args()
 
-    # Choose a category (supports weighted random and unknown fallback)
-    category = select_category(args.category)
+    if args.drain:
+        try:
+            queued = drain_batches()
+        except Exception as exc:
+            print(f"Error: {exc}")
+            return
+        print(f"Queued {queued} slip(s) in {QUEUE_DIR}.")
+        return
+
+    if args.batch > 0:
+        if args.categories:
+            categories = [select_category(c.strip()) for c in args.categories.split(",")]
+        else:
+            categories = [select_category(args.category) for _ in range(args.batch)]
+        try:
+            batch_id = submit_batch(categories, args.temperature, model=args.model)
+        except Exception as exc:
+            print(f"Error: {exc}")
+            return
+        print(f"Submitted batch {batch_id} ({len(categories)} request(s)); "
+              f"run --drain later to collect it.")
+        return
+
+    # Choose the categories (supports weighted random and unknown fallback)
+    if args.categories:
+        categories = [select_category(c.strip()) for c in args.categories.split(",")]
+    else:
+        categories = [select_category(args.category) for _ in range(max(args.count, 1))]
+
+    # A single snippet streams to stdout as tokens arrive, so printing starts
+    # at time-to-first-token instead of waiting on the whole completion.
+    if len(categories) == 1:
+        category = categories[0]
+        print(f"--- Category: {category} ---")
+        try:
+            for token in stream_content(category, args.temperature,
+                                        use_cache=not args.no_cache,
+                                        model=args.model):
+                sys.stdout.write(token)
+                sys.stdout.flush()
+        except Exception as exc:
+            print(f"Error: {exc}")
+            return
+        print("\n")
+        return
 
+    generate = generate_batch if args.one_call else generate_many
     try:
-        content = generate_content(category, args.temperature)
+        contents = generate(categories, args.temperature,
+                            use_cache=not args.no_cache, model=args.model)
     except Exception as exc:
         print(f"Error: {exc}")
         return
 
-    print(f"--- Category: {category} ---\n{content}\n")
+    for category, content in zip(categories, contents):
+        print(f"--- Category: {category} ---\n{content}\n")
 
 
 if __name__ == "__main__":